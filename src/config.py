@@ -1,13 +1,21 @@
 """Configuration management for Jellyfin Playback Validator."""
 
-import json
+import functools
+import os
+import orjson
 from pathlib import Path
 from typing import Optional
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+_DEFAULT_CONFIG = _PROJECT_ROOT / "config.json"
+_EXAMPLE_CONFIG = _PROJECT_ROOT / "config.example.json"
 
 
 class JellyfinConfig(BaseModel):
     """Jellyfin server configuration."""
+    model_config = ConfigDict(frozen=True)
+
     base_url: str
     web_base: str
     api_key: str
@@ -22,30 +30,58 @@ class JellyfinConfig(BaseModel):
 
 class ValidationConfig(BaseModel):
     """Validation settings."""
+    model_config = ConfigDict(frozen=True)
+
     max_films_per_run: int = Field(default=10, ge=1, le=100)
     timeout_seconds: int = Field(default=30, ge=5, le=120)
     pause_between_requests: float = Field(default=1.0, ge=0, le=10)
     filter_recent_only: bool = Field(default=True)
     recent_movies_limit: int = Field(default=50, ge=1, le=1000)
+    concurrency: int = Field(default=1, ge=1, le=16)
 
 
 class OutputConfig(BaseModel):
     """Output file settings."""
+    model_config = ConfigDict(frozen=True)
+
     backup_file: str = Field(default="defective_movies.txt")
     progress_file: str = Field(default="progress.json")
+    verbose: bool = Field(default=True)
 
 
 class Config(BaseModel):
     """Main configuration model."""
+    model_config = ConfigDict(frozen=True)
+
     jellyfin: JellyfinConfig
     validation: ValidationConfig = Field(default_factory=ValidationConfig)
     output: OutputConfig = Field(default_factory=OutputConfig)
 
 
+@functools.lru_cache(maxsize=4)
+def _load_config_cached(path_str: str, mtime_ns: int) -> Config:
+    """
+    Read and validate a config file, memoized per path and modification time.
+
+    Args:
+        path_str: Resolved path of the config file
+        mtime_ns: File modification time, only used as part of the cache key
+
+    Returns:
+        Validated Config object
+    """
+    with open(path_str, 'rb') as f:
+        return Config(**orjson.loads(f.read()))
+
+
 def load_config(config_path: Optional[Path] = None) -> Config:
     """
     Load configuration from JSON file.
 
+    The file is only re-read when its modification time changes, so repeated
+    calls return the same Config object; the models are frozen so that
+    shared object cannot be changed by one caller behind another's back.
+
     Args:
         config_path: Path to config file. Defaults to config.json in project root.
 
@@ -57,7 +93,7 @@ def load_config(config_path: Optional[Path] = None) -> Config:
         ValueError: If config is invalid
     """
     if config_path is None:
-        config_path = Path(__file__).parent.parent / "config.json"
+        config_path = _DEFAULT_CONFIG
 
     if not config_path.exists():
         raise FileNotFoundError(
@@ -65,10 +101,8 @@ def load_config(config_path: Optional[Path] = None) -> Config:
             f"Please create config.json based on config.example.json"
         )
 
-    with open(config_path, 'r', encoding='utf-8') as f:
-        config_data = json.load(f)
-
-    return Config(**config_data)
+    config_path = config_path.resolve()
+    return _load_config_cached(str(config_path), os.stat(config_path).st_mtime_ns)
 
 
 def create_example_config(output_path: Optional[Path] = None) -> None:
@@ -79,7 +113,7 @@ def create_example_config(output_path: Optional[Path] = None) -> None:
         output_path: Where to save the example. Defaults to config.example.json
     """
     if output_path is None:
-        output_path = Path(__file__).parent.parent / "config.example.json"
+        output_path = _EXAMPLE_CONFIG
 
     example_config = {
         "jellyfin": {
@@ -92,14 +126,16 @@ def create_example_config(output_path: Optional[Path] = None) -> None:
             "max_films_per_run": 10,
             "timeout_seconds": 30,
             "pause_between_requests": 1.0,
-            "filter_recent_only": true,
-            "recent_movies_limit": 50
+            "filter_recent_only": True,
+            "recent_movies_limit": 50,
+            "concurrency": 1
         },
         "output": {
             "backup_file": "defective_movies.txt",
-            "progress_file": "progress.json"
+            "progress_file": "progress.json",
+            "verbose": True
         }
     }
 
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(example_config, f, indent=2, ensure_ascii=False)
+    with open(output_path, 'wb') as f:
+        f.write(orjson.dumps(example_config, option=orjson.OPT_INDENT_2))
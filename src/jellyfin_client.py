@@ -1,26 +1,50 @@
 """Jellyfin API Client for movie validation."""
 
-import requests
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+import asyncio
+import time
+import httpx
+import msgspec
+import orjson
+from typing import Iterator, List, Dict, Any, Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Transient gateway errors are retried with exponential backoff
+_RETRY_STATUSES = frozenset({502, 503, 504})
+_MAX_RETRIES = 3
+_BACKOFF_FACTOR = 0.3
 
-@dataclass
-class MovieItem:
+
+class MovieItem(
+    msgspec.Struct,
+    frozen=True,
+    rename={'item_id': 'Id', 'name': 'Name', 'path': 'Path', 'year': 'ProductionYear'}
+):
     """Represents a movie from Jellyfin."""
     item_id: str
-    name: str
-    path: str
+    name: str = 'Unknown'
+    path: str = ''
     year: Optional[int] = None
 
 
+class _ItemsPage(msgspec.Struct, rename={'items': 'Items', 'total_record_count': 'TotalRecordCount'}):
+    """One page of the Items endpoint response."""
+    items: List[MovieItem] = []
+    total_record_count: int = 0
+
+
 class JellyfinClient:
     """Client for interacting with Jellyfin API."""
 
-    def __init__(self, base_url: str, api_key: str, user_id: str, timeout: int = 30):
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        user_id: str,
+        timeout: int = 30,
+        pool_size: int = 16
+    ):
         """
         Initialize Jellyfin client.
 
@@ -29,98 +53,312 @@ class JellyfinClient:
             api_key: API key for authentication
             user_id: User ID for requests
             timeout: Request timeout in seconds
+            pool_size: Maximum number of pooled keep-alive connections
         """
         self.base_url = base_url.rstrip('/')
         self.api_key = api_key
         self.user_id = user_id
         self.timeout = timeout
-        self.session = requests.Session()
-        self.session.headers.update({
+
+        # Prebuilt endpoint URLs, so per-movie calls only format in the item ID
+        self._items_url = f"{self.base_url}/Users/{self.user_id}/Items"
+        self._item_tpl = f"{self.base_url}/Users/{self.user_id}/Items/{{}}"
+        self._playback_info_tpl = f"{self.base_url}/Items/{{}}/PlaybackInfo"
+
+        # PlaybackInfo request body is identical for every movie
+        self._playback_body = orjson.dumps({'UserId': self.user_id})
+
+        # Typed decoders parse API JSON straight into MovieItems
+        self._items_decoder = msgspec.json.Decoder(_ItemsPage)
+        self._item_decoder = msgspec.json.Decoder(MovieItem)
+
+        self._headers = {
             'X-Emby-Token': api_key,
             'Content-Type': 'application/json'
-        })
+        }
+        # Keep every pooled connection alive between requests, so no request
+        # pays a new TCP + TLS handshake once the pool is warm
+        self._limits = httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+
+        # One HTTP/2 connection multiplexes concurrent requests.
+        # httpx advertises br in Accept-Encoding when brotli is installed.
+        self.session = httpx.Client(
+            timeout=timeout,
+            headers=self._headers,
+            transport=httpx.HTTPTransport(
+                http2=True,
+                retries=_MAX_RETRIES,
+                limits=self._limits
+            )
+        )
+
+    def create_async_session(self) -> httpx.AsyncClient:
+        """
+        Create an async HTTP client configured like the sync session.
+
+        The caller owns the client and must close it, e.g. with ``async with``.
+
+        Returns:
+            httpx.AsyncClient object
+        """
+        return httpx.AsyncClient(
+            timeout=self.timeout,
+            headers=self._headers,
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                retries=_MAX_RETRIES,
+                limits=self._limits
+            )
+        )
 
-    def _make_request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
+    def _make_request(self, method: str, url: str, **kwargs) -> httpx.Response:
         """
         Make HTTP request to Jellyfin API.
 
         Args:
             method: HTTP method (GET, POST, etc.)
-            endpoint: API endpoint (without base URL)
-            **kwargs: Additional arguments for requests
+            url: Full API URL
+            **kwargs: Additional arguments for httpx
 
         Returns:
             Response object
 
         Raises:
-            requests.RequestException: On request failure
+            httpx.HTTPError: On request failure
+        """
+        try:
+            for attempt in range(_MAX_RETRIES + 1):
+                response = self.session.request(method, url, **kwargs)
+                if response.status_code not in _RETRY_STATUSES or attempt == _MAX_RETRIES:
+                    break
+                time.sleep(_BACKOFF_FACTOR * 2 ** attempt)
+
+            response.raise_for_status()
+            return response
+        except httpx.HTTPError as e:
+            logger.error("Request failed for %s: %s", url, e)
+            raise
+
+    async def _make_request_async(
+        self,
+        session: httpx.AsyncClient,
+        method: str,
+        url: str,
+        **kwargs
+    ) -> httpx.Response:
         """
-        url = f"{self.base_url}{endpoint}"
-        kwargs.setdefault('timeout', self.timeout)
+        Make HTTP request to Jellyfin API on an async session.
+
+        Args:
+            session: Client from create_async_session()
+            method: HTTP method (GET, POST, etc.)
+            url: Full API URL
+            **kwargs: Additional arguments for httpx
+
+        Returns:
+            Response object
 
+        Raises:
+            httpx.HTTPError: On request failure
+        """
         try:
-            response = self.session.request(method, url, **kwargs)
+            for attempt in range(_MAX_RETRIES + 1):
+                response = await session.request(method, url, **kwargs)
+                if response.status_code not in _RETRY_STATUSES or attempt == _MAX_RETRIES:
+                    break
+                await asyncio.sleep(_BACKOFF_FACTOR * 2 ** attempt)
+
             response.raise_for_status()
             return response
-        except requests.RequestException as e:
-            logger.error(f"Request failed for {endpoint}: {e}")
+        except httpx.HTTPError as e:
+            logger.error("Request failed for %s: %s", url, e)
             raise
 
-    def get_all_movies(self, filter_recent: bool = False, limit: Optional[int] = None) -> List[MovieItem]:
+    def iter_movies(
+        self,
+        filter_recent: bool = False,
+        limit: Optional[int] = None,
+        page_size: int = 500
+    ) -> Iterator[MovieItem]:
         """
-        Fetch all movies from Jellyfin.
+        Iterate over movies from Jellyfin, fetching one page at a time.
+
+        Only a single page of the response is held in memory, and the next page
+        is requested once the caller has consumed the current one.
 
         Args:
             filter_recent: If True, fetch only recently added movies
             limit: Maximum number of movies to return (only used if filter_recent=True)
+            page_size: Number of movies requested per API call
 
-        Returns:
-            List of MovieItem objects
+        Yields:
+            MovieItem objects
 
         Raises:
-            requests.RequestException: On API error
+            httpx.HTTPError: On API error
         """
-        endpoint = f"/Users/{self.user_id}/Items"
         params = {
             'IncludeItemTypes': 'Movie',
             'Recursive': 'true',
             'Fields': 'Path,ProductionYear,DateCreated',
         }
 
+        remaining = None
         if filter_recent and limit:
             # Sort by date added (descending) and limit
             params['SortBy'] = 'DateCreated'
             params['SortOrder'] = 'Descending'
-            params['Limit'] = str(limit)
+            remaining = limit
         else:
             # Sort by name for all movies
             params['SortBy'] = 'SortName'
             params['SortOrder'] = 'Ascending'
 
+        start_index = 0
+        while remaining is None or remaining > 0:
+            page_limit = page_size if remaining is None else min(page_size, remaining)
+            params['StartIndex'] = str(start_index)
+            params['Limit'] = str(page_limit)
+
+            response = self._make_request('GET', self._items_url, params=params)
+            items = self._items_decoder.decode(response.content).items
+            yield from items
+
+            # A short page means the server has no more movies
+            if len(items) < page_limit:
+                break
+
+            start_index += len(items)
+            if remaining is not None:
+                remaining -= len(items)
+
+    def get_all_movies(
+        self,
+        filter_recent: bool = False,
+        limit: Optional[int] = None,
+        page_size: int = 500
+    ) -> List[MovieItem]:
+        """
+        Fetch all movies from Jellyfin.
+
+        Args:
+            filter_recent: If True, fetch only recently added movies
+            limit: Maximum number of movies to return (only used if filter_recent=True)
+            page_size: Number of movies requested per API call
+
+        Returns:
+            List of MovieItem objects
+
+        Raises:
+            httpx.HTTPError: On API error
+        """
         try:
-            response = self._make_request('GET', endpoint, params=params)
-            data = response.json()
-
-            movies = []
-            for item in data.get('Items', []):
-                movie = MovieItem(
-                    item_id=item['Id'],
-                    name=item.get('Name', 'Unknown'),
-                    path=item.get('Path', ''),
-                    year=item.get('ProductionYear')
-                )
-                movies.append(movie)
+            movies = list(self.iter_movies(filter_recent, limit, page_size))
 
             if filter_recent and limit:
-                logger.info(f"Retrieved {len(movies)} recently added movies from Jellyfin (limit: {limit})")
+                logger.info("Retrieved %s recently added movies from Jellyfin (limit: %s)", len(movies), limit)
             else:
-                logger.info(f"Retrieved {len(movies)} movies from Jellyfin")
+                logger.info("Retrieved %s movies from Jellyfin", len(movies))
             return movies
 
         except Exception as e:
-            logger.error(f"Failed to retrieve movies: {e}")
+            logger.error("Failed to retrieve movies: %s", e)
+            raise
+
+    def get_movie_count(self) -> int:
+        """
+        Get the number of movies in the library without fetching them.
+
+        Returns:
+            Total number of movies reported by Jellyfin
+
+        Raises:
+            httpx.HTTPError: On API error
+        """
+        params = {
+            'IncludeItemTypes': 'Movie',
+            'Recursive': 'true',
+            'Limit': '0',
+        }
+
+        try:
+            response = self._make_request('GET', self._items_url, params=params)
+            count = self._items_decoder.decode(response.content).total_record_count
+
+            logger.info("Jellyfin reports %s movies", count)
+            return count
+
+        except Exception as e:
+            logger.error("Failed to count movies: %s", e)
             raise
 
+    def get_playback_info(self, item_id: str) -> Dict[str, Any]:
+        """
+        Fetch the raw PlaybackInfo response for an item.
+
+        Args:
+            item_id: Jellyfin item ID
+
+        Returns:
+            Decoded PlaybackInfo response
+
+        Raises:
+            httpx.HTTPError: On API error
+        """
+        response = self._make_request(
+            'POST',
+            self._playback_info_tpl.format(item_id),
+            content=self._playback_body
+        )
+        return orjson.loads(response.content)
+
+    def check_playback_info(self, item_id: str, data: Dict[str, Any]) -> bool:
+        """
+        Check a PlaybackInfo response for a playable media source.
+
+        Args:
+            item_id: Jellyfin item ID
+            data: Decoded response from get_playback_info()
+
+        Returns:
+            True if playback is possible, False otherwise
+        """
+        # Check for error codes in response
+        error_code = data.get('ErrorCode')
+        if error_code:
+            logger.warning("Item %s has error: %s", item_id, error_code)
+            return False
+
+        # Check if media sources are available
+        media_sources = data.get('MediaSources', [])
+        if not media_sources:
+            logger.warning("No media sources found for item %s", item_id)
+            return False
+
+        # Check if file exists and has valid properties
+        first_source = media_sources[0]
+
+        # File must have a valid path
+        if not first_source.get('Path'):
+            logger.warning("Item %s has no file path", item_id)
+            return False
+
+        # File must have a size > 0
+        if first_source.get('Size', 0) == 0:
+            logger.warning("Item %s has zero file size", item_id)
+            return False
+
+        # Must have at least one video stream
+        for stream in first_source.get('MediaStreams', []):
+            if stream.get('Type') == 'Video':
+                break
+        else:
+            logger.warning("Item %s has no video stream", item_id)
+            return False
+
+        logger.debug("Playback test successful for item %s", item_id)
+        return True
+
     def test_playback(self, item_id: str) -> bool:
         """
         Test if a movie can be played back.
@@ -131,55 +369,41 @@ class JellyfinClient:
         Returns:
             True if playback is possible, False otherwise
         """
-        endpoint = f"/Items/{item_id}/PlaybackInfo"
-        payload = {
-            'UserId': self.user_id
-        }
+        try:
+            return self.check_playback_info(item_id, self.get_playback_info(item_id))
+
+        except httpx.HTTPError as e:
+            logger.error("Playback test failed for item %s: %s", item_id, e)
+            return False
+        except Exception as e:
+            logger.error("Unexpected error during playback test for %s: %s", item_id, e)
+            return False
+
+    async def test_playback_async(self, item_id: str, session: httpx.AsyncClient) -> bool:
+        """
+        Test if a movie can be played back, without blocking the event loop.
+
+        Args:
+            item_id: Jellyfin item ID
+            session: Client from create_async_session()
 
+        Returns:
+            True if playback is possible, False otherwise
+        """
         try:
-            response = self._make_request('POST', endpoint, json=payload)
-            data = response.json()
-
-            # Check for error codes in response
-            if data.get('ErrorCode'):
-                logger.warning(f"Item {item_id} has error: {data.get('ErrorCode')}")
-                return False
-
-            # Check if media sources are available
-            media_sources = data.get('MediaSources', [])
-            if not media_sources:
-                logger.warning(f"No media sources found for item {item_id}")
-                return False
-
-            # Check if file exists and has valid properties
-            first_source = media_sources[0]
-
-            # File must have a valid path
-            if not first_source.get('Path'):
-                logger.warning(f"Item {item_id} has no file path")
-                return False
-
-            # File must have a size > 0
-            file_size = first_source.get('Size', 0)
-            if file_size == 0:
-                logger.warning(f"Item {item_id} has zero file size")
-                return False
-
-            # Must have at least one video stream
-            media_streams = first_source.get('MediaStreams', [])
-            has_video = any(stream.get('Type') == 'Video' for stream in media_streams)
-            if not has_video:
-                logger.warning(f"Item {item_id} has no video stream")
-                return False
-
-            logger.debug(f"Playback test successful for item {item_id}")
-            return True
-
-        except requests.RequestException as e:
-            logger.error(f"Playback test failed for item {item_id}: {e}")
+            response = await self._make_request_async(
+                session,
+                'POST',
+                self._playback_info_tpl.format(item_id),
+                content=self._playback_body
+            )
+            return self.check_playback_info(item_id, orjson.loads(response.content))
+
+        except httpx.HTTPError as e:
+            logger.error("Playback test failed for item %s: %s", item_id, e)
             return False
         except Exception as e:
-            logger.error(f"Unexpected error during playback test for {item_id}: {e}")
+            logger.error("Unexpected error during playback test for %s: %s", item_id, e)
             return False
 
     def get_item_details(self, item_id: str) -> Optional[MovieItem]:
@@ -192,22 +416,14 @@ class JellyfinClient:
         Returns:
             MovieItem object or None if failed
         """
-        endpoint = f"/Users/{self.user_id}/Items/{item_id}"
         params = {
             'Fields': 'Path,ProductionYear'
         }
 
         try:
-            response = self._make_request('GET', endpoint, params=params)
-            item = response.json()
-
-            return MovieItem(
-                item_id=item['Id'],
-                name=item.get('Name', 'Unknown'),
-                path=item.get('Path', ''),
-                year=item.get('ProductionYear')
-            )
+            response = self._make_request('GET', self._item_tpl.format(item_id), params=params)
+            return self._item_decoder.decode(response.content)
 
         except Exception as e:
-            logger.error(f"Failed to get item details for {item_id}: {e}")
+            logger.error("Failed to get item details for %s: %s", item_id, e)
             return None
@@ -1,13 +1,11 @@
 """Main CLI entry point for Jellyfin Playback Validator."""
 
+import os
 import sys
+import asyncio
 import logging
 from pathlib import Path
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
-from rich.panel import Panel
-from rich.table import Table
-from rich import box
 
 from .config import load_config
 from .jellyfin_client import JellyfinClient
@@ -26,12 +24,20 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# httpx logs every request at INFO level
+logging.getLogger('httpx').setLevel(logging.WARNING)
+
 # Rich console for pretty output
 console = Console()
 
+# Output files are resolved relative to the project root
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
 
 def print_header(config):
     """Print application header."""
+    from rich.panel import Panel
+
     console.print()
     console.print(Panel.fit(
         "[bold cyan]Jellyfin Playback Validator[/bold cyan]",
@@ -54,6 +60,9 @@ def print_progress_stats(stats, batch_num, total_batches):
 
 def print_summary(validation_results, stats):
     """Print validation summary."""
+    from rich import box
+    from rich.table import Table
+
     console.print()
     console.print("[bold cyan]=== Summary ===[/bold cyan]")
 
@@ -79,6 +88,24 @@ def print_summary(validation_results, stats):
     console.print()
 
 
+async def run_batch(client, validator, movies, concurrency, on_result):
+    """
+    Validate movies concurrently, reporting each result as it completes.
+
+    Playback checks are I/O-bound, so up to `concurrency` requests are in
+    flight at once over a shared async session.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with client.create_async_session() as session:
+
+        async def validate(movie):
+            async with semaphore:
+                await validator.validate_and_track(movie, session, on_result)
+
+        await asyncio.gather(*(validate(movie) for movie in movies))
+
+
 def main():
     """Main application entry point."""
     try:
@@ -89,86 +116,79 @@ def main():
         print_header(config)
 
         # Initialize components
-        project_root = Path(__file__).parent.parent
-
         client = JellyfinClient(
             base_url=config.jellyfin.base_url,
             api_key=config.jellyfin.api_key,
             user_id=config.jellyfin.user_id,
-            timeout=config.validation.timeout_seconds
-        )
-
-        progress_tracker = ProgressTracker(
-            progress_file=project_root / config.output.progress_file
+            timeout=config.validation.timeout_seconds,
+            # One connection per concurrent playback check is enough
+            pool_size=config.validation.concurrency
         )
 
-        validator = MovieValidator(
+        # Leaving the block (also on interrupt) compacts the progress log
+        # and closes the backup file
+        with ProgressTracker(
+            progress_file=_PROJECT_ROOT / config.output.progress_file
+        ) as progress_tracker, MovieValidator(
             client=client,
-            backup_file=project_root / config.output.backup_file,
+            backup_file=_PROJECT_ROOT / config.output.backup_file,
             pause_between=config.validation.pause_between_requests
-        )
-
-        # Fetch movies based on filter settings
-        if config.validation.filter_recent_only:
-            console.print(f"[dim]Loading {config.validation.recent_movies_limit} most recently added movies from Jellyfin...[/dim]")
-            all_movies = client.get_all_movies(
-                filter_recent=True,
-                limit=config.validation.recent_movies_limit
+        ) as validator:
+
+            # Fetch movies based on filter settings
+            if config.validation.filter_recent_only:
+                console.print(f"[dim]Loading {config.validation.recent_movies_limit} most recently added movies from Jellyfin...[/dim]")
+                all_movies = client.get_all_movies(
+                    filter_recent=True,
+                    limit=config.validation.recent_movies_limit
+                )
+                total_movies = len(all_movies)
+            else:
+                console.print("[dim]Counting movies in Jellyfin...[/dim]")
+                total_movies = client.get_movie_count()
+                # Pages are only fetched as far as needed to fill the next batch
+                all_movies = client.iter_movies()
+
+            if not total_movies:
+                console.print("[red]No movies found![/red]")
+                return 1
+
+            # Initialize progress with total count
+            progress_tracker.initialize_with_total(total_movies)
+
+            # Get current stats
+            stats = progress_tracker.get_stats()
+
+            # Check if already completed
+            if progress_tracker.is_completed():
+                console.print("[bold green]All movies have already been tested![/bold green]")
+                console.print()
+                print_summary({'total': 0, 'ok': 0, 'defect': 0}, stats)
+                return 0
+
+            # Get next batch, stopping at the first max_films_per_run untested movies
+            batch_movies = progress_tracker.get_next_batch(
+                all_movies,
+                config.validation.max_films_per_run,
+                key=lambda movie: movie.item_id
             )
-        else:
-            console.print("[dim]Loading all movies from Jellyfin...[/dim]")
-            all_movies = client.get_all_movies()
-
-        if not all_movies:
-            console.print("[red]No movies found![/red]")
-            return 1
 
-        # Initialize progress with total count
-        progress_tracker.initialize_with_total(len(all_movies))
+            if not batch_movies:
+                console.print("[yellow]No new movies to test.[/yellow]")
+                return 0
 
-        # Get current stats
-        stats = progress_tracker.get_stats()
+            # Test movies from the same folder back to back, so the server reads
+            # its storage sequentially; progress is keyed by ID, so order is free
+            batch_movies.sort(key=lambda m: (os.path.dirname(m.path or ''), m.name))
 
-        # Check if already completed
-        if progress_tracker.is_completed():
-            console.print("[bold green]All movies have already been tested![/bold green]")
-            console.print()
-            print_summary({'total': 0, 'ok': 0, 'defect': 0}, stats)
-            return 0
-
-        # Get next batch
-        all_movie_ids = [movie.item_id for movie in all_movies]
-        batch_ids = progress_tracker.get_next_batch(
-            all_movie_ids,
-            config.validation.max_films_per_run
-        )
-
-        if not batch_ids:
-            console.print("[yellow]No new movies to test.[/yellow]")
-            return 0
+            # Calculate batch number
+            batch_num = (stats['tested'] // config.validation.max_films_per_run) + 1
+            total_batches = (stats['total'] + config.validation.max_films_per_run - 1) // config.validation.max_films_per_run
 
-        # Get movie objects for batch
-        batch_movies = [m for m in all_movies if m.item_id in batch_ids]
+            print_progress_stats(stats, batch_num, total_batches)
 
-        # Calculate batch number
-        batch_num = (stats['tested'] // config.validation.max_films_per_run) + 1
-        total_batches = (stats['total'] + config.validation.max_films_per_run - 1) // config.validation.max_films_per_run
-
-        print_progress_stats(stats, batch_num, total_batches)
-
-        # Validate batch with progress bar
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TaskProgressColumn(),
-            console=console
-        ) as progress:
-
-            task = progress.add_task(
-                f"[cyan]Testing movies {stats['tested']+1}-{stats['tested']+len(batch_movies)}...",
-                total=len(batch_movies)
-            )
+            # Imported here so runs with nothing to test skip loading rich.progress
+            from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
 
             validation_results = {
                 'total': len(batch_movies),
@@ -176,38 +196,64 @@ def main():
                 'defect': 0
             }
 
-            for i, movie in enumerate(batch_movies):
-                # Update progress description
-                progress.update(
-                    task,
-                    description=f"[cyan]Testing: {movie.name}",
-                    completed=i
-                )
-
-                # Validate movie
-                is_ok = validator.validate_movie(movie)
-
-                # Track result
-                if is_ok:
-                    validation_results['ok'] += 1
-                    console.print(f"  [green]OK[/green]  {movie.name}")
-                else:
-                    validation_results['defect'] += 1
-                    console.print(f"  [red]FAIL[/red] {movie.name} - DEFECTIVE")
-
-                # Mark as tested
-                progress_tracker.mark_as_tested(movie.item_id, is_defect=not is_ok)
+            # Per-movie result lines, printed in one go after the progress bar
+            result_lines = []
+
+            try:
+                # Validate batch with progress bar
+                with Progress(
+                    SpinnerColumn(),
+                    TextColumn("[progress.description]{task.description}"),
+                    BarColumn(),
+                    TaskProgressColumn(),
+                    console=console,
+                    refresh_per_second=4
+                ) as progress:
+
+                    task = progress.add_task(
+                        f"[cyan]Testing movies {stats['tested']+1}-{stats['tested']+len(batch_movies)}...",
+                        total=len(batch_movies)
+                    )
+
+                    def on_result(movie, is_ok):
+                        # Track result
+                        if is_ok:
+                            validation_results['ok'] += 1
+                            result_lines.append(f"  [green]OK[/green]  {movie.name}")
+                        else:
+                            validation_results['defect'] += 1
+                            result_lines.append(f"  [red]FAIL[/red] {movie.name} - DEFECTIVE")
+
+                        # Mark as tested (appended to the progress log)
+                        progress_tracker.mark_as_tested(movie.item_id, is_defect=not is_ok)
+
+                        # Update progress bar
+                        progress.update(
+                            task,
+                            description=f"[cyan]Tested: {movie.name}",
+                            advance=1
+                        )
+
+                    asyncio.run(run_batch(
+                        client,
+                        validator,
+                        batch_movies,
+                        config.validation.concurrency,
+                        on_result
+                    ))
+
+            finally:
+                # Also list the movies finished before an interrupt or error
+                if config.output.verbose and result_lines:
+                    console.print("\n".join(result_lines))
+
+            # Get updated stats
+            stats = progress_tracker.get_stats()
+
+            # Print summary
+            print_summary(validation_results, stats)
 
-                # Update progress bar
-                progress.update(task, completed=i + 1)
-
-        # Get updated stats
-        stats = progress_tracker.get_stats()
-
-        # Print summary
-        print_summary(validation_results, stats)
-
-        return 0
+            return 0
 
     except FileNotFoundError as e:
         console.print(f"[red]Error:[/red] {e}")
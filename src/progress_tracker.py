@@ -1,13 +1,18 @@
 """Progress tracking for movie validation."""
 
-import json
+import atexit
+import os
+from itertools import islice
+import orjson
 from pathlib import Path
-from typing import List, Set, Optional
-from dataclasses import dataclass, asdict
+from typing import BinaryIO, Callable, Iterable, List, Set, Optional, TypeVar
+from dataclasses import dataclass
 import logging
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar('T')
+
 
 @dataclass
 class Progress:
@@ -22,6 +27,10 @@ class Progress:
         if self.defect_films is None:
             self.defect_films = []
 
+        # Mirrors of the lists for O(1) membership checks (not serialized)
+        self._tested_set = set(self.tested_films)
+        self._defect_set = set(self.defect_films)
+
 
 class ProgressTracker:
     """Tracks validation progress across multiple runs."""
@@ -34,11 +43,38 @@ class ProgressTracker:
             progress_file: Path to progress JSON file
         """
         self.progress_file = progress_file
+        # Append-only log of films marked since the last snapshot
+        self._wal_path = progress_file.with_suffix('.wal')
+        self._wal_fh: Optional[BinaryIO] = None
+        self._wal_entries = 0
+        # Set when the log could not be read, so it is never deleted unreplayed
+        self._wal_unreadable = False
         self.progress = self._load_progress()
 
+        # Last resort for compacting the log if the tracker is never closed
+        atexit.register(self.flush)
+
+    def __enter__(self) -> 'ProgressTracker':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.flush()
+        atexit.unregister(self.flush)
+
     def _load_progress(self) -> Progress:
         """
-        Load progress from file.
+        Load progress from file and replay the log on top of it.
+
+        Returns:
+            Progress object
+        """
+        progress = self._load_snapshot()
+        self._replay_wal(progress)
+        return progress
+
+    def _load_snapshot(self) -> Progress:
+        """
+        Load the JSON progress snapshot.
 
         Returns:
             Progress object
@@ -48,8 +84,8 @@ class ProgressTracker:
             return Progress()
 
         try:
-            with open(self.progress_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(self.progress_file, 'rb') as f:
+                data = orjson.loads(f.read())
 
             progress = Progress(
                 total_films=data.get('total_films', 0),
@@ -68,19 +104,96 @@ class ProgressTracker:
             logger.warning("Starting with fresh progress")
             return Progress()
 
-    def save_progress(self) -> None:
-        """Save current progress to file."""
+    def _replay_wal(self, progress: Progress) -> None:
+        """
+        Apply films logged after the last snapshot, e.g. from a killed run.
+
+        Args:
+            progress: Progress object to update in place
+        """
+        if not self._wal_path.exists():
+            return
+
         try:
-            data = asdict(self.progress)
+            with open(self._wal_path, 'rb') as f:
+                for line in f:
+                    try:
+                        entry = orjson.loads(line)
+                        item_id, is_defect = entry['id'], bool(entry['d'])
+                    except (orjson.JSONDecodeError, KeyError, TypeError):
+                        # Torn line from a crash mid-write, or a malformed entry
+                        logger.warning(f"Skipping unreadable entry in {self._wal_path.name}")
+                        continue
+                    self._apply(progress, item_id, is_defect)
+                    self._wal_entries += 1
+
+            logger.info(f"Replayed {self._wal_entries} entries from {self._wal_path.name}")
 
-            with open(self.progress_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+        except Exception as e:
+            self._wal_unreadable = True
+            logger.error(f"Failed to replay progress log, keeping it for the next run: {e}")
+
+    @staticmethod
+    def _apply(progress: Progress, item_id: str, is_defect: bool) -> bool:
+        """
+        Record a tested film in a Progress object.
+
+        Args:
+            progress: Progress object to update
+            item_id: Jellyfin item ID
+            is_defect: Whether the film is defective
+
+        Returns:
+            True if the progress changed, False if already recorded
+        """
+        changed = False
+        if item_id not in progress._tested_set:
+            progress._tested_set.add(item_id)
+            progress.tested_films.append(item_id)
+            changed = True
+
+        if is_defect and item_id not in progress._defect_set:
+            progress._defect_set.add(item_id)
+            progress.defect_films.append(item_id)
+            changed = True
+
+        return changed
+
+    def save_progress(self) -> None:
+        """Save a full snapshot of current progress and clear the log."""
+        try:
+            # Serialize the lists in place instead of deep-copying them with asdict
+            progress = self.progress
+            data = orjson.dumps({
+                'total_films': progress.total_films,
+                'tested_films': progress.tested_films,
+                'defect_films': progress.defect_films
+            }, option=orjson.OPT_INDENT_2)
+
+            # Write to a temp file and swap it in, so a crash never leaves a torn file
+            tmp_file = self.progress_file.with_name(self.progress_file.name + '.tmp')
+            with open(tmp_file, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_file, self.progress_file)
+
+            # Everything in the log is now part of the snapshot
+            if self._wal_fh is not None:
+                self._wal_fh.close()
+                self._wal_fh = None
+            if not self._wal_unreadable:
+                self._wal_path.unlink(missing_ok=True)
+            self._wal_entries = 0
 
             logger.debug("Progress saved successfully")
 
         except Exception as e:
             logger.error(f"Failed to save progress: {e}")
 
+    def flush(self) -> None:
+        """Compact logged films into the progress snapshot, if there are any."""
+        if self._wal_entries:
+            self.save_progress()
+
     def initialize_with_total(self, total_films: int) -> None:
         """
         Initialize progress with total film count.
@@ -104,25 +217,35 @@ class ProgressTracker:
         Get set of tested film IDs.
 
         Returns:
-            Set of item IDs
+            Live set of item IDs; callers must not modify it
         """
-        return set(self.progress.tested_films)
-
-    def get_next_batch(self, all_films: List[str], batch_size: int) -> List[str]:
+        return self.progress._tested_set
+
+    def get_next_batch(
+        self,
+        all_films: Iterable[T],
+        batch_size: int,
+        key: Optional[Callable[[T], str]] = None
+    ) -> List[T]:
         """
         Get next batch of untested films.
 
         Args:
-            all_films: List of all film IDs
+            all_films: All films in validation order (any iterable, e.g. a lazy page iterator)
             batch_size: Number of films to return
+            key: Returns a film's item ID; defaults to the film itself being the ID
 
         Returns:
-            List of film IDs to test
+            List of films to test
         """
         tested_set = self.get_tested_set()
-        untested = [film_id for film_id in all_films if film_id not in tested_set]
+        if key is None:
+            untested = (film for film in all_films if film not in tested_set)
+        else:
+            untested = (film for film in all_films if key(film) not in tested_set)
 
-        batch = untested[:batch_size]
+        # Stop scanning as soon as the batch is full
+        batch = list(islice(untested, batch_size))
         logger.info(f"Selected {len(batch)} films for next batch")
         return batch
 
@@ -130,18 +253,48 @@ class ProgressTracker:
         """
         Mark a film as tested.
 
+        The film is appended to the progress log right away; flush() folds
+        the log into the JSON snapshot.
+
         Args:
             item_id: Jellyfin item ID
             is_defect: Whether the film is defective
         """
-        if item_id not in self.progress.tested_films:
-            self.progress.tested_films.append(item_id)
+        if not self._apply(self.progress, item_id, is_defect):
+            return
+
+        # One small append per film instead of rewriting the whole snapshot
+        try:
+            if self._wal_fh is None:
+                self._wal_fh = self._open_wal()
+            self._wal_fh.write(orjson.dumps({'id': item_id, 'd': int(is_defect)}) + b'\n')
+            self._wal_fh.flush()
+            self._wal_entries += 1
 
-        if is_defect and item_id not in self.progress.defect_films:
-            self.progress.defect_films.append(item_id)
+        except Exception as e:
+            logger.error(f"Failed to append to progress log: {e}")
 
-        # Save after each film to prevent data loss
-        self.save_progress()
+    def _open_wal(self) -> BinaryIO:
+        """
+        Open the progress log for appending.
+
+        A log left by a run killed mid-write can end in a torn line without
+        a newline; that line is terminated first so the next entry does not
+        get glued onto it.
+
+        Returns:
+            Binary file handle positioned at the end of the log
+        """
+        fh = open(self._wal_path, 'a+b')
+        try:
+            if fh.seek(0, os.SEEK_END) > 0:
+                fh.seek(-1, os.SEEK_END)
+                if fh.read(1) != b'\n':
+                    fh.write(b'\n')
+        except Exception:
+            fh.close()
+            raise
+        return fh
 
     def is_completed(self) -> bool:
         """
@@ -174,17 +327,17 @@ class ProgressTracker:
         Returns:
             Dictionary with statistics
         """
+        total = self.progress.total_films
         tested_count = len(self.progress.tested_films)
         defect_count = len(self.progress.defect_films)
-        ok_count = tested_count - defect_count
 
         return {
-            'total': self.progress.total_films,
+            'total': total,
             'tested': tested_count,
-            'ok': ok_count,
+            'ok': tested_count - defect_count,
             'defect': defect_count,
-            'percentage': self.get_completion_percentage(),
-            'remaining': self.progress.total_films - tested_count
+            'percentage': (tested_count / total) * 100 if total else 0.0,
+            'remaining': total - tested_count
         }
 
     def is_film_tested(self, item_id: str) -> bool:
@@ -197,7 +350,7 @@ class ProgressTracker:
         Returns:
             True if tested, False otherwise
         """
-        return item_id in self.progress.tested_films
+        return item_id in self.progress._tested_set
 
     def is_film_defect(self, item_id: str) -> bool:
         """
@@ -209,4 +362,4 @@ class ProgressTracker:
         Returns:
             True if defective, False otherwise
         """
-        return item_id in self.progress.defect_films
+        return item_id in self.progress._defect_set
@@ -1,11 +1,14 @@
 """Validation logic for Jellyfin movies."""
 
+import asyncio
 import time
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import Callable, Optional, TextIO
 import logging
 
+import httpx
+
 from .jellyfin_client import JellyfinClient, MovieItem
 
 logger = logging.getLogger(__name__)
@@ -31,6 +34,19 @@ class MovieValidator:
         self.client = client
         self.backup_file = backup_file
         self.pause_between = pause_between
+        self._backup_fh: Optional[TextIO] = None
+
+    def __enter__(self) -> 'MovieValidator':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the backup file if it was opened."""
+        if self._backup_fh is not None:
+            self._backup_fh.close()
+            self._backup_fh = None
 
     def validate_movie(self, movie: MovieItem) -> bool:
         """
@@ -46,12 +62,7 @@ class MovieValidator:
 
         # Test playback
         is_playable = self.client.test_playback(movie.item_id)
-
-        if not is_playable:
-            logger.warning(f"DEFECT found: {movie.name}")
-            self._handle_defective_movie(movie)
-        else:
-            logger.debug(f"OK: {movie.name}")
+        self._record_result(movie, is_playable)
 
         # Pause to avoid overwhelming the server
         if self.pause_between > 0:
@@ -59,6 +70,53 @@ class MovieValidator:
 
         return is_playable
 
+    async def validate_and_track(
+        self,
+        movie: MovieItem,
+        session: httpx.AsyncClient,
+        on_result: Callable[[MovieItem, bool], None]
+    ) -> bool:
+        """
+        Validate a single movie on an async session and report the result.
+
+        on_result is called as soon as the result is known, before the pause,
+        so callers can update progress and UI in one place.
+
+        Args:
+            movie: MovieItem to validate
+            session: Client from JellyfinClient.create_async_session()
+            on_result: Callback receiving the movie and whether it is playable
+
+        Returns:
+            True if movie is playable, False if defective
+        """
+        logger.info(f"Validating: {movie.name} ({movie.year or 'N/A'})")
+
+        # Test playback
+        is_playable = await self.client.test_playback_async(movie.item_id, session)
+        self._record_result(movie, is_playable)
+        on_result(movie, is_playable)
+
+        # Pause to avoid overwhelming the server
+        if self.pause_between > 0:
+            await asyncio.sleep(self.pause_between)
+
+        return is_playable
+
+    def _record_result(self, movie: MovieItem, is_playable: bool) -> None:
+        """
+        Log a validation result and handle defective movies.
+
+        Args:
+            movie: Validated MovieItem
+            is_playable: Result of the playback test
+        """
+        if not is_playable:
+            logger.warning(f"DEFECT found: {movie.name}")
+            self._handle_defective_movie(movie)
+        else:
+            logger.debug(f"OK: {movie.name}")
+
     def _handle_defective_movie(self, movie: MovieItem) -> None:
         """
         Handle a defective movie: write to backup file.
@@ -69,6 +127,23 @@ class MovieValidator:
         # Write to backup file
         self._write_to_backup(movie)
 
+    def _ensure_backup_open(self) -> TextIO:
+        """
+        Open the backup file for appending, once per validator.
+
+        Returns:
+            Open file handle
+        """
+        if self._backup_fh is None:
+            self._backup_fh = open(self.backup_file, 'a', encoding='utf-8')
+
+            # Write header if the file is new
+            if self._backup_fh.tell() == 0:
+                self._backup_fh.write("=== Defective Movies ===\n")
+                self._backup_fh.write(f"Created: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+
+        return self._backup_fh
+
     def _write_to_backup(self, movie: MovieItem) -> None:
         """
         Write defective movie to backup text file.
@@ -77,20 +152,15 @@ class MovieValidator:
             movie: Defective MovieItem
         """
         try:
-            # Create file with header if it doesn't exist
-            if not self.backup_file.exists():
-                with open(self.backup_file, 'w', encoding='utf-8') as f:
-                    f.write("=== Defective Movies ===\n")
-                    f.write(f"Created: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-
-            # Append defective movie
-            with open(self.backup_file, 'a', encoding='utf-8') as f:
-                display_name = movie.name
-                if movie.year:
-                    display_name = f"{movie.name} ({movie.year})"
-
-                f.write(f"- {display_name}\n")
-                f.write(f"  {movie.path}\n\n")
+            f = self._ensure_backup_open()
+
+            display_name = movie.name
+            if movie.year:
+                display_name = f"{movie.name} ({movie.year})"
+
+            f.write(f"- {display_name}\n  {movie.path}\n\n")
+            # Keep the file current in case the run is killed
+            f.flush()
 
             logger.debug(f"Wrote {movie.name} to backup file")
 
@@ -1,19 +1,21 @@
 """Test script to analyze Jellyfin PlaybackInfo API response."""
 
-import requests
 import json
+import sys
 
-# Configuration
-BASE_URL = "https://tv.einsle.com"
-API_KEY = "3e1e7c4998064adda1ffcfafaf1c125a"
-USER_ID = "693a254c5e134e95b7a97b2fddfa794b"
+import httpx
 
-# Setup session
-session = requests.Session()
-session.headers.update({
-    'X-Emby-Token': API_KEY,
-    'Content-Type': 'application/json'
-})
+from src.config import load_config
+from src.jellyfin_client import JellyfinClient
+
+# Use the same configuration and client as the validator
+config = load_config()
+client = JellyfinClient(
+    base_url=config.jellyfin.base_url,
+    api_key=config.jellyfin.api_key,
+    user_id=config.jellyfin.user_id,
+    timeout=config.validation.timeout_seconds
+)
 
 print("=" * 80)
 print("JELLYFIN API TEST - Fetching first movie")
@@ -21,64 +23,40 @@ print("=" * 80)
 
 # Get first movie
 print("\n1. Fetching movie list...")
-response = session.get(
-    f"{BASE_URL}/Users/{USER_ID}/Items",
-    params={
-        'IncludeItemTypes': 'Movie',
-        'Recursive': 'true',
-        'Fields': 'Path,ProductionYear',
-        'SortBy': 'SortName',
-        'SortOrder': 'Ascending',
-        'Limit': 1
-    },
-    timeout=30
-)
-
-movies = response.json()
-if not movies.get('Items'):
+movie = next(client.iter_movies(page_size=1), None)
+if movie is None:
     print("No movies found!")
-    exit(1)
+    sys.exit(1)
 
-movie = movies['Items'][0]
-print(f"   Movie: {movie['Name']} ({movie.get('ProductionYear', 'N/A')})")
-print(f"   ID: {movie['Id']}")
-print(f"   Path: {movie.get('Path', 'N/A')}")
+print(f"   Movie: {movie.name} ({movie.year or 'N/A'})")
+print(f"   ID: {movie.item_id}")
+print(f"   Path: {movie.path or 'N/A'}")
 
 # Test playback
 print("\n2. Testing PlaybackInfo API...")
-playback_response = session.post(
-    f"{BASE_URL}/Items/{movie['Id']}/PlaybackInfo",
-    json={
-        'UserId': USER_ID,
-        'DeviceProfile': {
-            'MaxStaticBitrate': 140000000,
-            'MusicStreamingTranscodingBitrate': 384000
-        }
-    },
-    timeout=30
-)
-
-print(f"   Status Code: {playback_response.status_code}")
-
-if playback_response.status_code == 200:
-    playback_data = playback_response.json()
-
-    print("\n3. Response Analysis:")
-    print(f"   MediaSources present: {len(playback_data.get('MediaSources', []))}")
-
-    if playback_data.get('MediaSources'):
-        source = playback_data['MediaSources'][0]
-        print(f"   SupportsDirectStream: {source.get('SupportsDirectStream')}")
-        print(f"   SupportsDirectPlay: {source.get('SupportsDirectPlay')}")
-        print(f"   SupportsTranscoding: {source.get('SupportsTranscoding')}")
-        print(f"   Container: {source.get('Container')}")
-
-    if playback_data.get('ErrorCode'):
-        print(f"   ERROR CODE: {playback_data['ErrorCode']}")
-
-    print("\n4. Full Response (formatted):")
-    print(json.dumps(playback_data, indent=2))
-else:
-    print(f"   ERROR: {playback_response.text}")
+try:
+    playback_data = client.get_playback_info(movie.item_id)
+except httpx.HTTPError as e:
+    print(f"   ERROR: {e}")
+    sys.exit(1)
+
+# Check the same response that is analysed and dumped below
+print(f"   Playback test: {'OK' if client.check_playback_info(movie.item_id, playback_data) else 'DEFECTIVE'}")
+
+print("\n3. Response Analysis:")
+print(f"   MediaSources present: {len(playback_data.get('MediaSources', []))}")
+
+if playback_data.get('MediaSources'):
+    source = playback_data['MediaSources'][0]
+    print(f"   SupportsDirectStream: {source.get('SupportsDirectStream')}")
+    print(f"   SupportsDirectPlay: {source.get('SupportsDirectPlay')}")
+    print(f"   SupportsTranscoding: {source.get('SupportsTranscoding')}")
+    print(f"   Container: {source.get('Container')}")
+
+if playback_data.get('ErrorCode'):
+    print(f"   ERROR CODE: {playback_data['ErrorCode']}")
+
+print("\n4. Full Response (formatted):")
+print(json.dumps(playback_data, indent=2))
 
 print("\n" + "=" * 80)